@@ -8,9 +8,13 @@ Helper routines for loading ExaSPIM related data.
 
 """
 
-import ast
 import pandas as pd
 
+try:
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None
+
 from aind_exaspim_dataset_utils import s3_util
 
 
@@ -41,8 +45,9 @@ def load_soma_locations(brain_id, return_path=False):
     # Find most recent result
     if prefix_list:
         dirname = find_most_recent_dirname(prefix_list)
-        path = f"s3://{bucket_name}/{prefix}/{dirname}/somas-{brain_id}.csv"
-        soma_locations = list(pd.read_csv(path)["xyz"].apply(ast.literal_eval))
+        key = f"{prefix}/{dirname}/somas-{brain_id}.csv"
+        path = f"s3://{bucket_name}/{key}"
+        soma_locations = _read_soma_csv(bucket_name, key)
         if return_path:
             return soma_locations, path
         else:
@@ -51,6 +56,60 @@ def load_soma_locations(brain_id, return_path=False):
         return list()
 
 
+def _read_soma_csv(bucket_name, key):
+    """
+    Reads the "xyz" column of a soma CSV stored in S3.
+
+    Parameters
+    ----------
+    bucket_name : str
+        Name of the S3 bucket containing the CSV file.
+    key : str
+        Key of the CSV file within the bucket.
+
+    Returns
+    -------
+    List[Tuple[float]]
+        Physical coordinates representing soma locations.
+    """
+    obj = s3_util.get_s3().get_object(Bucket=bucket_name, Key=key)
+    if pa_csv is not None:
+        table = pa_csv.read_csv(
+            obj["Body"],
+            read_options=pa_csv.ReadOptions(use_threads=True),
+            convert_options=pa_csv.ConvertOptions(include_columns=["xyz"]),
+        )
+        return [_parse_xyz(s) for s in table.column("xyz").to_pylist()]
+    else:
+        soma_locations = list()
+        chunks = pd.read_csv(
+            obj["Body"],
+            usecols=["xyz"],
+            converters={"xyz": _parse_xyz},
+            chunksize=200_000,
+        )
+        for chunk in chunks:
+            soma_locations.extend(chunk["xyz"].values)
+        return soma_locations
+
+
+def _parse_xyz(xyz_str):
+    """
+    Parses a string representation of a 3D coordinate into a Python tuple.
+
+    Parameters
+    ----------
+    xyz_str : str
+        String representation of a 3D coordinate, e.g. "(1.0, 2.0, 3.0)".
+
+    Returns
+    -------
+    Tuple[float]
+        3D coordinate.
+    """
+    return tuple(map(float, xyz_str.strip("()[] ").split(",")))
+
+
 def find_most_recent_dirname(results_prefix_list):
     """
     Find the most recent results directory name from a list of S3 prefixes.
@@ -66,8 +125,8 @@ def find_most_recent_dirname(results_prefix_list):
     str
         Directory name with the most recent date.
     """
-    dates = list()
-    for prefix in results_prefix_list:
-        dirname = prefix.split("/")[-2]
-        dates.append(dirname.replace("results_", ""))
-    return "results_" + sorted(dates)[-1]
+    # Dates are formatted as YYYYMMDD, so lexicographic max is most recent
+    return "results_" + max(
+        p.rstrip("/").rsplit("/", 1)[-1].removeprefix("results_")
+        for p in results_prefix_list
+    )
@@ -10,6 +10,11 @@ Helper routines used in this repo.
 
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # --- Read ---
 def read_json(path):
@@ -26,8 +31,12 @@ def read_json(path):
     dict
         Contents of JSON file.
     """
-    with open(path, "r") as f:
-        return json.load(f)
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    else:
+        with open(path, "r") as f:
+            return json.load(f)
 
 
 # --- Write ---
@@ -46,5 +55,9 @@ def write_json(path, contents):
     -------
     None
     """
-    with open(path, "w") as f:
-        json.dump(contents, f)
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(contents))
+    else:
+        with open(path, "w") as f:
+            json.dump(contents, f)
@@ -10,15 +10,64 @@ Helper routines for working with images stored in an S3 bucket.
 
 from botocore import UNSIGNED
 from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 import boto3
 import numpy as np
 import os
 import s3fs
+import threading
 import zarr
 
 from aind_exaspim_dataset_utils import io_util
 
+_S3_CLIENT = None
+
+_PREFIX_LOOKUPS = dict()
+_PREFIX_LOOKUP_LOCK = threading.Lock()
+
+
+# --- Clients ---
+def get_s3():
+    """
+    Gets a lazily initialized, module-level anonymous S3 client shared
+    across this package.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    botocore.client.S3
+        Shared anonymous S3 client.
+    """
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        _S3_CLIENT = boto3.client(
+            "s3",
+            config=Config(signature_version=UNSIGNED, max_pool_connections=32),
+        )
+    return _S3_CLIENT
+
+
+@lru_cache(maxsize=1)
+def _get_s3fs():
+    """
+    Gets a lazily initialized, module-level anonymous S3 filesystem.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    s3fs.S3FileSystem
+        Shared anonymous S3 filesystem.
+    """
+    return s3fs.S3FileSystem(anon=True)
+
 
 # --- General ---
 def exists_in_prefix(bucket_name, prefix, target_name):
@@ -40,21 +89,21 @@ def exists_in_prefix(bucket_name, prefix, target_name):
     bool
         Indication of whether a given file is in a prefix.
     """
-    s3 = boto3.client("s3", config=Config(signature_version=UNSIGNED))
-    paginator = s3.get_paginator("list_objects_v2")
-    pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter="/")
-    for page in pages:
-        # Check for files directly under the prefix
-        for obj in page.get("Contents", []):
-            name = obj["Key"].split("/")[-1]
-            if name == target_name:
-                return True
-
-        # Check for immediate subdirectories
-        for common_prefix in page.get("CommonPrefixes", []):
-            name = common_prefix["Prefix"].rstrip("/").split("/")[-1]
-            if name == target_name:
-                return True
+    # Check prefix ending
+    if not prefix.endswith("/"):
+        prefix += "/"
+
+    # Single scoped listing decides existence in one round trip
+    target = prefix + target_name
+    response = get_s3().list_objects_v2(
+        Bucket=bucket_name, Prefix=target, Delimiter="/"
+    )
+    for obj in response.get("Contents", []):
+        if obj["Key"] == target:
+            return True
+    for common_prefix in response.get("CommonPrefixes", []):
+        if common_prefix["Prefix"] == target + "/":
+            return True
     return False
 
 
@@ -68,7 +117,10 @@ def list_bucket_prefixes(bucket_name, keyword=None):
     bucket_name : str
         Name of the S3 bucket to search.
     keyword : str, optional
-        Keyword used to filter the prefixes.
+        Keyword used to filter the prefixes. Applied server-side as a name
+        prefix so only matching entries are listed; since S3 prefix matching
+        is case-sensitive, an empty result falls back to a client-side
+        case-insensitive scan of the full listing.
 
     Returns
     --------
@@ -76,23 +128,49 @@ def list_bucket_prefixes(bucket_name, keyword=None):
         Top-level prefixes (directories) in the S3 bucket. If a keyword is
         provided, only the matching prefixes are returned.
     """
+    prefixes = _list_top_level_prefixes(bucket_name, prefix=keyword)
+    if keyword and not prefixes:
+        prefixes = [
+            p
+            for p in _list_top_level_prefixes(bucket_name)
+            if keyword.lower() in p.lower()
+        ]
+    return prefixes
+
+
+def _list_top_level_prefixes(bucket_name, prefix=None):
+    """
+    Lists top-level prefixes (directories) in an S3 bucket, optionally
+    narrowed server-side by a name prefix.
+
+    Parameters
+    -----------
+    bucket_name : str
+        Name of the S3 bucket to search.
+    prefix : str, optional
+        Name prefix passed to the list_objects_v2 API.
+
+    Returns
+    --------
+    List[str]
+        Top-level prefixes (directories) in the S3 bucket.
+    """
     prefixes = list()
     continuation_token = None
-    s3 = boto3.client("s3", config=Config(signature_version=UNSIGNED))
+    s3 = get_s3()
     while True:
         # Call the list_objects_v2 API
         list_kwargs = {"Bucket": bucket_name, "Delimiter": "/"}
+        if prefix:
+            list_kwargs["Prefix"] = prefix
         if continuation_token:
             list_kwargs["ContinuationToken"] = continuation_token
         response = s3.list_objects_v2(**list_kwargs)
 
         # Collect the top-level prefixes
         if "CommonPrefixes" in response:
-            for prefix in response["CommonPrefixes"]:
-                if keyword and keyword in prefix["Prefix"].lower():
-                    prefixes.append(prefix["Prefix"])
-                elif keyword is None:
-                    prefixes.append(prefix["Prefix"])
+            for common_prefix in response["CommonPrefixes"]:
+                prefixes.append(common_prefix["Prefix"])
 
         # Check if there are more pages to fetch
         if response.get("IsTruncated"):
@@ -123,7 +201,7 @@ def list_prefixes(bucket_name, prefix):
         prefix += "/"
 
     # Call the list_objects_v2 API
-    s3 = boto3.client("s3", config=Config(signature_version=UNSIGNED))
+    s3 = get_s3()
     response = s3.list_objects_v2(
         Bucket=bucket_name, Prefix=prefix, Delimiter="/"
     )
@@ -152,7 +230,7 @@ def get_img_prefix(brain_id, prefix_lookup_path=None):
     """
     # Check prefix lookup
     if prefix_lookup_path:
-        prefix_lookup = io_util.read_json(prefix_lookup_path)
+        prefix_lookup = _load_prefix_lookup(prefix_lookup_path)
         if brain_id in prefix_lookup:
             return prefix_lookup[brain_id]
 
@@ -161,13 +239,40 @@ def get_img_prefix(brain_id, prefix_lookup_path=None):
     if len(result) == 1:
         prefix = result[0] + "/"
         if prefix_lookup_path:
-            prefix_lookup[brain_id] = prefix
-            io_util.write_json(prefix_lookup_path, prefix_lookup)
+            with _PREFIX_LOOKUP_LOCK:
+                prefix_lookup[brain_id] = prefix
+                io_util.write_json(prefix_lookup_path, prefix_lookup)
+                mtime = os.path.getmtime(prefix_lookup_path)
+                _PREFIX_LOOKUPS[prefix_lookup_path] = (mtime, prefix_lookup)
         return prefix
 
     raise Exception(f"Brain_ID={brain_id} Failed: Image Paths Found {result}")
 
 
+def _load_prefix_lookup(path):
+    """
+    Loads a brain ID to prefix lookup from a JSON file, reusing the parsed
+    dictionary on subsequent calls as long as the file is unchanged.
+
+    Parameters
+    ----------
+    path : str
+        Path to a JSON file that caches brain ID to prefix mappings.
+
+    Returns
+    -------
+    dict
+        Dictionary that maps brain IDs to image prefixes.
+    """
+    with _PREFIX_LOOKUP_LOCK:
+        mtime = os.path.getmtime(path)
+        cached = _PREFIX_LOOKUPS.get(path)
+        if cached is None or cached[0] != mtime:
+            _PREFIX_LOOKUPS[path] = (mtime, io_util.read_json(path))
+        return _PREFIX_LOOKUPS[path][1]
+
+
+@lru_cache(maxsize=512)
 def find_img_prefix(brain_id):
     """
     Finds the image prefix path for a given brain ID.
@@ -184,26 +289,56 @@ def find_img_prefix(brain_id):
     """
     # Initializations
     bucket_name = "aind-open-data"
-    keyword = f"exaspim_{brain_id}"
+    keyword = f"exaSPIM_{brain_id}"
     prefixes = list_bucket_prefixes(bucket_name, keyword=keyword)
 
-    # Get possible prefixes
+    # Validate candidate prefixes concurrently (network-bound)
     valid_prefixes = list()
-    for prefix in prefixes:
-        # Check for new naming convention
-        if exists_in_prefix(bucket_name, prefix, "fusion"):
-            prefix = os.path.join(prefix, "fusion")
-
-        # Check if prefix is valid
-        if is_valid_img_prefix(bucket_name, prefix, brain_id):
-            prefix = os.path.join("s3://aind-open-data", prefix, "fused.zarr")
-
-            # Check if shape is plausible
-            if is_shape_plausible(prefix):
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        threads = [
+            executor.submit(_validate_prefix, bucket_name, p, brain_id)
+            for p in prefixes
+        ]
+        for thread in as_completed(threads):
+            prefix = thread.result()
+            if prefix:
                 valid_prefixes.append(prefix)
     return valid_prefixes
 
 
+def _validate_prefix(bucket_name, prefix, brain_id):
+    """
+    Validates a single candidate image prefix for a given brain ID.
+
+    Parameters
+    ----------
+    bucket_name : str
+        Name of the S3 bucket containing the given prefix.
+    prefix : str
+        Candidate prefix to validate.
+    brain_id : str
+        Brain ID used to determine if the image prefix is valid.
+
+    Returns
+    -------
+    str or None
+        Full S3 path to the fused.zarr image if the prefix is valid,
+        None otherwise.
+    """
+    # Check for new naming convention
+    if exists_in_prefix(bucket_name, prefix, "fusion"):
+        prefix = f"{prefix.rstrip('/')}/fusion"
+
+    # Check if prefix is valid
+    if is_valid_img_prefix(bucket_name, prefix, brain_id):
+        prefix = f"s3://aind-open-data/{prefix.rstrip('/')}/fused.zarr"
+
+        # Check if shape is plausible
+        if is_shape_plausible(prefix):
+            return prefix
+    return None
+
+
 def is_valid_img_prefix(bucket_name, prefix, brain_id):
     """
     Determines whether a given image prefix is valid for a specific brain ID.
@@ -235,15 +370,13 @@ def is_valid_img_prefix(bucket_name, prefix, brain_id):
     if not has_correct_id or is_test:
         return False
 
-    # Check if prefix is function
-    if exists_in_prefix(bucket_name, prefix, "fused.zarr"):
-        img_prefix = os.path.join(prefix, "fused.zarr")
-        multiscales = list_prefixes(bucket_name, img_prefix)
-        multiscales = [s.split("/")[-2] for s in multiscales]
-        for s in map(str, range(0, 8)):
-            if s not in multiscales:
-                return False
-    return True
+    # Check that fused.zarr exists and contains all multiscales
+    img_prefix = f"{prefix.rstrip('/')}/fused.zarr"
+    multiscales = list_prefixes(bucket_name, img_prefix)
+    if not multiscales:
+        return False
+    names = {s.rstrip("/").split("/")[-1] for s in multiscales}
+    return all(str(s) in names for s in range(0, 8))
 
 
 def is_shape_plausible(prefix):
@@ -262,11 +395,13 @@ def is_shape_plausible(prefix):
         Indication of whether the shape is plausible.
     """
     try:
-        root = os.path.join(prefix, str(0))
-        store = s3fs.S3Map(root=root, s3=s3fs.S3FileSystem(anon=True))
-        img = zarr.open(store, mode="r")        
+        root = f"{prefix.rstrip('/')}/0"
+        store = s3fs.S3Map(
+            root=root, s3=_get_s3fs(), check=False, create=False
+        )
+        img = zarr.open_array(store, mode="r")
         if np.max(img.shape) > 25000:
             return True
-    except Exception as e:
+    except Exception:
         pass
     return False
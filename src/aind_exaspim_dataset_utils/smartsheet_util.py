@@ -10,11 +10,16 @@ this file are marked using the convention -- {Smartsheet Name} --- .
 """
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import ast
+import numpy as np
 import pandas as pd
+import re
 import smartsheet
 
+_XYZ_PATTERN = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+
 
 class SmartSheetClient:
     """
@@ -32,9 +37,16 @@ class SmartSheetClient:
         Loaded sheet object.
     column_name_to_id : dict
         Dictionary mapping column names (titles) to their corresponding IDs.
+    _cell_lookup : List[dict]
+        Per-row dictionaries mapping column IDs to cell objects.
+    _display_to_row_id : dict
+        Dictionary mapping cell display values to the ID of the first row
+        containing them.
     """
 
-    def __init__(self, access_token, sheet_name, is_workspace_sheet=False):
+    def __init__(
+        self, access_token, sheet_name, is_workspace_sheet=False, columns=None
+    ):
         """
         Instantiates a SmartSheetClient object.
 
@@ -48,6 +60,9 @@ class SmartSheetClient:
         is_workspace_sheet : bool, optional
             Indication of whether to look for the sheet within a workspace.
             Default is False.
+        columns : List[str] or None, optional
+            If provided, only these columns are fetched from the sheet,
+            reducing payload size and parse time. Default is None.
 
         Returns
         -------
@@ -62,10 +77,25 @@ class SmartSheetClient:
             self.sheet_id = self.find_workspace_sheet_id()
         else:
             self.sheet_id = self.find_sheet_id()
-        self.sheet = self.client.Sheets.get_sheet(self.sheet_id)
+        if columns:
+            column_ids = self.resolve_column_ids(columns)
+            self.sheet = self.client.Sheets.get_sheet(
+                self.sheet_id, column_ids=column_ids
+            )
+        else:
+            self.sheet = self.client.Sheets.get_sheet(self.sheet_id)
 
         # Lookups
         self.column_name_to_id = {c.title: c.id for c in self.sheet.columns}
+        self._cell_lookup = [
+            {c.column_id: c for c in row.cells} for row in self.sheet.rows
+        ]
+        self._display_to_row_id = dict()
+        for row in self.sheet.rows:
+            for cell in row.cells:
+                value = cell.display_value
+                if value is not None and value not in self._display_to_row_id:
+                    self._display_to_row_id[value] = row.id
 
     # --- Lookup Routines ---
     def find_workspace_sheet_id(self):
@@ -81,11 +111,16 @@ class SmartSheetClient:
         int
             ID of the matching sheet.
         """
-        for ws in self.client.Workspaces.list_workspaces().data:
-            workspace = self.client.Workspaces.get_workspace(ws.id)
-            for sheet in workspace.sheets:
-                if sheet.name == self.sheet_name:
-                    return sheet.id
+        workspaces = self.client.Workspaces.list_workspaces().data
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            iterator = executor.map(
+                lambda ws: self.client.Workspaces.get_workspace(ws.id),
+                workspaces,
+            )
+            for workspace in iterator:
+                for sheet in workspace.sheets:
+                    if sheet.name == self.sheet_name:
+                        return sheet.id
         raise Exception(f"Sheet Not Found - sheet_name={self.sheet_name}")
 
     def find_sheet_id(self):
@@ -108,6 +143,26 @@ class SmartSheetClient:
                 return sheet.id
         raise Exception(f"Sheet Not Found - sheet_name={self.sheet_name}")
 
+    def resolve_column_ids(self, column_names):
+        """
+        Resolves column names to column IDs via a lightweight columns fetch.
+
+        Parameters
+        ----------
+        column_names : List[str]
+            Names (titles) of the columns to resolve.
+
+        Returns
+        -------
+        List[int]
+            IDs of the given columns.
+        """
+        response = self.client.Sheets.get_columns(
+            self.sheet_id, include_all=True
+        )
+        name_to_id = {c.title: c.id for c in response.data}
+        return [name_to_id[name] for name in column_names]
+
     def find_row_id(self, keyword):
         """
         Locates the row ID of the first row containing a cell with the given
@@ -123,11 +178,10 @@ class SmartSheetClient:
         int
             ID of the row containing the keyword.
         """
-        for row in self.sheet.rows:
-            for cell in row.cells:
-                if cell.display_value == keyword:
-                    return row.id
-        raise Exception(f"Row Not Found - keyword={keyword}")
+        row_id = self._display_to_row_id.get(keyword)
+        if row_id is None:
+            raise Exception(f"Row Not Found - keyword={keyword}")
+        return row_id
 
     # --- Getters ---
     def get_children_map(self):
@@ -171,9 +225,9 @@ class SmartSheetClient:
         """
         row_idxs = list()
         col_id = self.column_name_to_id[column_name]
-        for idx, row in enumerate(self.sheet.rows):
-            cell = next((c for c in row.cells if c.column_id == col_id), None)
-            value = cell.display_value or cell.value
+        for idx, cells in enumerate(self._cell_lookup):
+            cell = cells.get(col_id)
+            value = cell.display_value or cell.value if cell else None
             if isinstance(value, str):
                 if value.lower() == row_value.lower():
                     row_idxs.append(idx)
@@ -195,10 +249,9 @@ class SmartSheetClient:
         str or any
             Cell's display value if available, otherwise the raw value.
         """
-        row = self.sheet.rows[row_idx]
         col_id = self.column_name_to_id[column_name]
-        cell = next((c for c in row.cells if c.column_id == col_id), None)
-        return cell.display_value or cell.value
+        cell = self._cell_lookup[row_idx].get(col_id)
+        return cell.display_value or cell.value if cell else None
 
     # --- Miscellaneous ---
     def to_dataframe(self):
@@ -217,15 +270,14 @@ class SmartSheetClient:
         """
         # Extract column titles
         columns = list(self.column_name_to_id.keys())
+        col_ids = [self.column_name_to_id[title] for title in columns]
 
         # Extract row data
-        data = []
-        for row in self.sheet.rows:
-            row_data = []
-            for cell in row.cells:
-                val = cell.value if cell.display_value else cell.display_value
-                row_data.append(val)
-            data.append(row_data)
+        data = np.empty((len(self._cell_lookup), len(col_ids)), dtype=object)
+        for i, cells in enumerate(self._cell_lookup):
+            for j, col_id in enumerate(col_ids):
+                cell = cells.get(col_id)
+                data[i, j] = cell.display_value or cell.value if cell else None
         return pd.DataFrame(data, columns=columns)
 
     def update_rows(self, updated_row):
@@ -245,6 +297,16 @@ class SmartSheetClient:
 
 
 # --- ExaSPIM Merge Locations ---
+MERGE_SITE_COLUMNS = [
+    "Sample",
+    "Merge Confirmation",
+    "Reviewed?",
+    "Segmentation ID",
+    "Ground Truth ID",
+    "World Coordinates",
+]
+
+
 def extract_merge_sites(smartsheet_client, verbose=True):
     """
     Extracts confirmed merge sites from the 'ExaSPIM Merge Locations'
@@ -254,6 +316,8 @@ def extract_merge_sites(smartsheet_client, verbose=True):
     ----------
     smartsheet_client : SmartSheetClient
         Instance of SmartSheetClient that provides access to the sheet.
+        Construct it with "columns=MERGE_SITE_COLUMNS" to fetch only the
+        columns used here.
     verbose : bool, optional
         Indication of whether to printout merge sites stats while loading.
 
@@ -264,44 +328,50 @@ def extract_merge_sites(smartsheet_client, verbose=True):
         including 'brain_id' and 'segmentation_id'.
     """
     children_map = smartsheet_client.get_children_map()
-    merge_site_dfs = list()
+    df = smartsheet_client.to_dataframe()
+    merge_sites = {
+        "brain_id": [],
+        "segmentation_id": [],
+        "segment_id": [],
+        "groundtruth_id": [],
+        "xyz": [],
+    }
     n_merge_sites, n_reviewed_sites = 0, 0
     for parent_idx, child_idxs in children_map.items():
         # Extract information
         sample_name = smartsheet_client.get_value(parent_idx, "Sample")
         brain_id, segmentation_id = sample_name.split("_", 1)
-        sites, n = find_confirmed_merge_sites(smartsheet_client, child_idxs)
+        sites, n = find_confirmed_merge_sites(df, child_idxs)
 
         # Compile results
-        if len(sites["xyz"]) > 0:
-            results = {
-                "brain_id": len(sites["xyz"]) * [brain_id],
-                "segmentation_id": len(sites["xyz"]) * [segmentation_id]
-            }
-            results.update(sites)
-            merge_site_dfs.append(pd.DataFrame(results))
+        n_sites = len(sites["xyz"])
+        if n_sites > 0:
+            merge_sites["brain_id"].extend(n_sites * [brain_id])
+            merge_sites["segmentation_id"].extend(n_sites * [segmentation_id])
+            for key in ("segment_id", "groundtruth_id", "xyz"):
+                merge_sites[key].extend(sites[key])
 
             n_reviewed_sites += n
-            n_merge_sites += len(sites["xyz"])
-            success_rate = len(sites["xyz"]) / n
+            n_merge_sites += n_sites
             if verbose:
-                print(f"{brain_id} - Success Rate:", success_rate)
+                print(f"{brain_id} - Success Rate:", n_sites / n)
 
     # Report results
     if verbose:
         print("\nOverall Success Rate:", n_merge_sites / n_reviewed_sites)
         print("# Confirmed Merge Sites:", n_merge_sites)
-    return pd.concat(merge_site_dfs, ignore_index=True)
+    return pd.DataFrame(merge_sites)
 
 
-def find_confirmed_merge_sites(smartsheet_client, idxs):
+def find_confirmed_merge_sites(df, idxs):
     """
     Identifies confirmed merge sites from a list of Smartsheet row indices.
 
     Parameters
     ----------
-    smartsheet_client : SmartSheetClient
-        Instance of the SmartSheetClient used to fetch cell values.
+    df : pd.DataFrame
+        DataFrame representation of the sheet, see
+        "SmartSheetClient.to_dataframe".
     idxs : list of int
         Row indices to evaluate for merge confirmations.
 
@@ -315,24 +385,16 @@ def find_confirmed_merge_sites(smartsheet_client, idxs):
             - "xyz": list of (x, y, z) coordinates
         - int: number of reviewed sites (regardless of confirmation)
     """
-    sites = {"segment_id": [], "groundtruth_id": [], "xyz": []}
-    n_reviewed_sites = 0
-    for i in idxs:
-        is_merge = smartsheet_client.get_value(i, "Merge Confirmation")
-        is_reviewed = smartsheet_client.get_value(i, "Reviewed?")
-        if is_merge and is_reviewed:
-            sites["segment_id"].append(
-                smartsheet_client.get_value(i, "Segmentation ID")
-            )
-            sites["groundtruth_id"].append(
-                smartsheet_client.get_value(i, "Ground Truth ID")
-            )
-            sites["xyz"].append(
-                read_xyz(smartsheet_client.get_value(i, "World Coordinates"))
-            )
-        if is_reviewed:
-            n_reviewed_sites += 1
-    return sites, n_reviewed_sites
+    sub = df.iloc[idxs]
+    is_reviewed = sub["Reviewed?"].fillna(False).astype(bool)
+    is_merge = sub["Merge Confirmation"].fillna(False).astype(bool)
+    confirmed = sub[is_reviewed & is_merge]
+    sites = {
+        "segment_id": confirmed["Segmentation ID"].tolist(),
+        "groundtruth_id": confirmed["Ground Truth ID"].tolist(),
+        "xyz": parse_xyz_bulk(confirmed["World Coordinates"].values),
+    }
+    return sites, int(is_reviewed.sum())
 
 
 # --- Neuron Reconstruction ---
@@ -420,6 +482,30 @@ def get_coordinates(smartsheet_client, row_idxs, status=None):
 
 
 # --- Helpers ---
+def parse_xyz_bulk(xyz_strs):
+    """
+    Parses a batch of 3D coordinate strings with a compiled regex, avoiding
+    the per-string AST compile overhead of "read_xyz".
+
+    Parameters
+    ----------
+    xyz_strs : Iterable[str]
+        String representations of 3D coordinates.
+
+    Returns
+    -------
+    List[Tuple[float]]
+        3D coordinates. Malformed entries are filled with NaNs.
+    """
+    xyz_arr = np.full((len(xyz_strs), 3), np.nan, dtype=np.float64)
+    for i, xyz_str in enumerate(xyz_strs):
+        if isinstance(xyz_str, str):
+            matches = _XYZ_PATTERN.findall(xyz_str)
+            if len(matches) >= 3:
+                xyz_arr[i] = [float(m) for m in matches[:3]]
+    return list(map(tuple, xyz_arr))
+
+
 def read_xyz(xyz_str):
     """
     Parses a string representation of a 3D coordinate into a Python tuple.